@@ -0,0 +1,562 @@
+"""Benchmarks for the Life Tracker API and bot jobs.
+
+Needs a throwaway Postgres database: every run drops and recreates all tables.
+
+    DATABASE_URL=postgresql://localhost/lifetracker_bench python bench.py all --users 1000 10000 100000
+
+Each user count is seeded with synthetic users, transactions, habits and
+moods, then the scenario runs against it. API requests go through the ASGI
+app in-process; bot messages go to a local fake Telegram Bot API server, so
+nothing touches the network. The fake server also runs on its own:
+
+    uvicorn bench:telegram_app --port 8081  # then TELEGRAM_API_URL=http://127.0.0.1:8081
+
+Results are printed as one JSON object per scenario and user count. The
+`json` scenario is CPU only and needs no database.
+"""
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import argparse
+import logging
+import statistics
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs
+
+import httpx
+import orjson
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, func, select, text
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from telegram.ext import Application
+
+import main
+
+# ==================== SYNTHETIC DATA ====================
+LANGUAGES = ["ru", "en", "es"]
+CATEGORIES = ["food", "transport", "rent", "fun", "health", "shopping"]
+HABITS = [("Read", "📚"), ("Run", "🏃"), ("Meditate", "🧘"), ("Water", "💧"), ("Sleep early", "😴")]
+
+async def reset_database():
+    async with main.engine.begin() as conn:
+        await conn.run_sync(main.Base.metadata.drop_all)
+    await main.init_db()
+
+async def copy_rows(table: str, columns: list[str], rows: list[tuple]):
+    """Bulk load through asyncpg COPY, far faster than ORM inserts for seeding"""
+    async with main.engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(table, records=rows, columns=columns)
+
+async def seed(users: int, days: int, tx_per_day: float, habits: int, seed_value: int = 42, batch: int = 2000):
+    """Create `users` users with `days` of transactions, habits, habit completions and moods"""
+    rng = random.Random(seed_value)
+    today = datetime.utcnow().date()
+    now = datetime.utcnow()
+
+    for first in range(1, users + 1, batch):
+        user_rows, data_rows, tx_rows, habit_rows, done_rows, mood_rows, month_rows = [], [], [], [], [], [], []
+        for telegram_id in range(first, min(first + batch, users + 1)):
+            user_rows.append((telegram_id, rng.choice(LANGUAGES), rng.randrange(-12, 15) * 60, True, now))
+            blob = {"settings": {"currency": "USD", "theme": rng.choice(["light", "dark"])},
+                    "categories": [{"id": c, "name": c.title()} for c in CATEGORIES]}
+            data_rows.append((telegram_id, json.dumps(blob), 0, True, now))
+
+            for n in range(int(days * tx_per_day)):
+                day = today - timedelta(days=rng.randrange(days))
+                kind = "income" if rng.random() < 0.1 else "expense"
+                amount = round(rng.uniform(500, 3000) if kind == "income" else rng.lognormvariate(2.5, 1), 2)
+                item = {"id": f"t{n}", "type": kind, "amount": amount, "convertedAmount": amount,
+                        "categoryId": rng.choice(CATEGORIES), "currency": "USD", "date": day.isoformat()}
+                tx_rows.append((telegram_id, item["id"], kind, amount, amount, item["categoryId"], day, json.dumps(item)))
+
+            mood_lifting = set()  # days of the first habit, which lifts the mood for half the users
+            for h in range(habits):
+                name, emoji = HABITS[h % len(HABITS)]
+                habit_id = f"h{h}"
+                rate = rng.uniform(0.3, 0.95)
+                done = [today - timedelta(days=d) for d in range(days) if rng.random() < rate]
+                history = main.HabitDays.from_days(done)
+                habit_rows.append((telegram_id, habit_id, name, emoji, json.dumps({"id": habit_id, "name": name, "emoji": emoji}),
+                                   history.origin, history.dump(), history.best_streak()))
+                done_rows.extend((telegram_id, habit_id, day) for day in done)
+                if h == 0 and telegram_id % 2:
+                    mood_lifting = set(done)
+
+            months = {}
+            for d in range(days):
+                if rng.random() < 0.6:
+                    day = today - timedelta(days=d)
+                    score = rng.choice([2, 3, 3, 4, 4, 4, 5]) if rng.random() > 0.1 else 1
+                    if day in mood_lifting and score < 5 and rng.random() < 0.5:
+                        score += 1
+                    mood_rows.append((telegram_id, datetime.combine(day, datetime.min.time()), score))
+                    digits = months.setdefault(day.replace(day=1), ["0"] * 31)
+                    digits[day.day - 1] = str(score)
+            month_rows.extend((telegram_id, month, "".join(digits)) for month, digits in months.items())
+
+        await copy_rows("users", ["telegram_id", "language", "timezone_offset", "notifications_enabled", "created_at"], user_rows)
+        await copy_rows("user_data", ["telegram_id", "data", "version", "normalized", "updated_at"], data_rows)
+        await copy_rows("transactions", ["telegram_id", "entity_id", "type", "amount", "converted_amount", "category_id", "day", "payload"], tx_rows)
+        await copy_rows("habits", ["telegram_id", "entity_id", "name", "emoji", "payload", "days_origin", "days", "best_streak"], habit_rows)
+        await copy_rows("habit_completions", ["telegram_id", "habit_id", "day"], done_rows)
+        await copy_rows("mood_entries", ["telegram_id", "date", "score"], mood_rows)
+        await copy_rows("mood_months", ["telegram_id", "month", "scores"], month_rows)
+
+    async with main.engine.begin() as conn:
+        await conn.exec_driver_sql("ANALYZE")
+
+def make_document(size: int, seed_value: int = 42) -> dict:
+    """A WebApp document of roughly `size` bytes of JSON, mostly transactions"""
+    rng = random.Random(seed_value)
+    today = datetime.utcnow().date()
+    doc = {
+        "settings": {"currency": "USD", "language": "en", "theme": "dark"},
+        "habits": [{"id": f"h{h}", "name": name, "emoji": emoji,
+                    "completedDates": [(today - timedelta(days=d)).isoformat() for d in range(30) if rng.random() < 0.7]}
+                   for h, (name, emoji) in enumerate(HABITS)],
+        "transactions": [],
+    }
+    approx = len(json.dumps(doc))
+    while approx < size:
+        amount = round(rng.lognormvariate(2.5, 1), 2)
+        item = {"id": f"t{len(doc['transactions'])}", "type": "expense", "amount": amount, "convertedAmount": amount,
+                "categoryId": rng.choice(CATEGORIES), "currency": "USD",
+                "date": (today - timedelta(days=rng.randrange(365))).isoformat(), "note": "café ☕"}
+        doc["transactions"].append(item)
+        approx += len(json.dumps(item)) + 2
+    return doc
+
+# ==================== FAKE TELEGRAM ====================
+# Stand-in for api.telegram.org: answers the Bot API methods the app calls and
+# counts them. FAKE_TELEGRAM_LATENCY_MS and FAKE_TELEGRAM_429_RATE shape it.
+FAKE_LATENCY = float(os.getenv("FAKE_TELEGRAM_LATENCY_MS", "0")) / 1000
+FAKE_429_RATE = float(os.getenv("FAKE_TELEGRAM_429_RATE", "0"))
+telegram_stats = defaultdict(int)
+telegram_chats = Counter()  # sendMessage calls per chat, to spot duplicate sends
+
+async def telegram_method(request: Request):
+    method = request.path_params["method"]
+    body = await request.body()
+    if request.headers.get("content-type", "").startswith("application/json"):
+        params = json.loads(body or b"{}")
+    else:
+        params = {key: values[-1] for key, values in parse_qs(body.decode()).items()}
+    if FAKE_LATENCY:
+        await asyncio.sleep(FAKE_LATENCY)
+
+    if method == "getMe":
+        result = {"id": 1, "is_bot": True, "first_name": "Bench", "username": "bench_bot"}
+    elif method in ("sendMessage", "editMessageText"):
+        if random.random() < FAKE_429_RATE:
+            telegram_stats["429"] += 1
+            return JSONResponse({"ok": False, "error_code": 429, "description": "Too Many Requests: retry after 1",
+                                 "parameters": {"retry_after": 1}}, status_code=429)
+        telegram_stats[method] += 1
+        if method == "sendMessage":
+            telegram_chats[params.get("chat_id")] += 1
+        result = {"message_id": telegram_stats[method], "date": int(time.time()), "text": params.get("text", ""),
+                  "chat": {"id": int(params.get("chat_id", 0)), "type": "private"}}
+    else:
+        result = True
+    return JSONResponse({"ok": True, "result": result})
+
+async def telegram_counts(request: Request):
+    return JSONResponse({**telegram_stats, "chats": len(telegram_chats),
+                         "duplicates": sum(count - 1 for count in telegram_chats.values())})
+
+telegram_app = Starlette(routes=[
+    Route("/stats", telegram_counts),
+    Route("/bot{token}/{method}", telegram_method, methods=["GET", "POST"]),
+])
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+@asynccontextmanager
+async def fake_telegram():
+    """Run telegram_app in a subprocess, so serving it doesn't eat into the measured process"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    server = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "uvicorn", "bench:telegram_app", "--port", str(port), "--log-level", "warning",
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    try:
+        async with httpx.AsyncClient(base_url=url) as client:
+            for _ in range(100):
+                try:
+                    await client.get("/stats")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("fake Telegram server did not start")
+
+            async def stats() -> dict:
+                return (await client.get("/stats")).json()
+            yield url, stats
+    finally:
+        server.terminate()
+        await server.wait()
+
+@asynccontextmanager
+async def connect_bot(url: str, rate: float):
+    """A bot Application wired to a fake server, with the given send rate limit"""
+    main.telegram_limiter = main.TokenBucket(rate / main.BOT_PROCESSES)
+    bot_app = Application.builder().token(main.BOT_TOKEN).base_url(f"{url}/bot").build()
+    await bot_app.initialize()
+    try:
+        yield bot_app
+    finally:
+        await bot_app.shutdown()
+
+@asynccontextmanager
+async def bot_application(args):
+    """A fake server and a bot wired to it; yields the bot and a sent-message counter"""
+    async with fake_telegram() as (url, stats), connect_bot(url, args.rate) as bot_app:
+        async def sent() -> int:
+            return (await stats()).get("sendMessage", 0)
+        yield bot_app, sent
+
+# ==================== SCENARIOS ====================
+def everyone(today) -> main.OffsetBucket:
+    """A bucket covering every timezone, for running a local-time job over all users at once"""
+    return main.OffsetBucket(main.MIN_UTC_OFFSET, main.MAX_UTC_OFFSET + 1, today)
+
+def latency_summary(seconds: list[float]) -> dict:
+    """Latency percentiles in milliseconds"""
+    cuts = statistics.quantiles(seconds, n=100, method="inclusive")
+    return {
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p95_ms": round(cuts[94] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+        "max_ms": round(max(seconds) * 1000, 2),
+    }
+
+def api_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://bench")
+
+async def run_clients(concurrency: int, requests: int, one) -> float:
+    """Call `one(n)` for n in range(requests) from `concurrency` clients; returns wall seconds"""
+    numbers = iter(range(requests))
+
+    async def client():
+        for n in numbers:
+            await one(n)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+async def bench_sync(args) -> dict:
+    """Delta syncs from concurrent WebApp clients: new expenses, some habit check-ins"""
+    rng = random.Random(7)
+    today = datetime.utcnow().date().isoformat()
+    async with main.async_session() as session:
+        offsets = dict((await session.execute(select(main.User.telegram_id, main.User.timezone_offset))).all())
+    versions = {}
+    latencies, statuses = [], Counter()
+
+    async def one(n: int):
+        telegram_id = rng.randint(1, args.users)
+        amount = round(rng.lognormvariate(2.5, 1), 2)
+        changes = [{"op": "put", "collection": "transactions", "id": f"bench{n}", "value": {
+            "type": "expense", "amount": amount, "convertedAmount": amount, "currency": "USD",
+            "categoryId": rng.choice(CATEGORIES), "date": today}}]
+        if n % 5 == 0:
+            name, emoji = HABITS[0]
+            changes.append({"op": "put", "collection": "habits", "id": "h0",
+                            "value": {"name": name, "emoji": emoji, "completedDates": [today]}})
+        body = {"telegram_id": telegram_id, "base_version": versions.get(telegram_id, 0),
+                "changes": changes, "timezone_offset": offsets.get(telegram_id, 0)}
+
+        started = time.perf_counter()
+        response = await client.post("/api/sync", json=body)
+        latencies.append(time.perf_counter() - started)
+        statuses[response.status_code] += 1
+        if response.status_code == 200:
+            versions[telegram_id] = max(versions.get(telegram_id, 0), response.json()["version"])
+
+    async with bot_application(args) as (bot_app, sent):
+        main.notifications.start(bot_app.bot)
+        async with api_client() as client:
+            seconds = await run_clients(args.concurrency, args.requests, one)
+        await main.notifications.stop()
+        notified = await sent()
+
+    return {
+        "scenario": "sync",
+        "users": args.users,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "statuses": dict(statuses),
+        "seconds": round(seconds, 3),
+        "requests_per_second": round(args.requests / seconds, 1),
+        **latency_summary(latencies),
+        "notifications_sent": notified,
+    }
+
+async def bench_data(args) -> dict:
+    """WebApp opens: a full fetch, a revalidation (304) and an incremental fetch per user"""
+    rng = random.Random(11)
+    latencies = {"full": [], "not_modified": [], "since": []}
+    sizes, statuses = [], Counter()
+
+    async def timed(kind: str, url: str, headers: dict = None) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.get(url, headers=headers)
+        latencies[kind].append(time.perf_counter() - started)
+        statuses[f"{kind}_{response.status_code}"] += 1
+        return response
+
+    async def one(n: int):
+        telegram_id = rng.randint(1, args.users)
+        full = await timed("full", f"/api/data/{telegram_id}")
+        sizes.append(int(full.headers.get("content-length", len(full.content))))
+        await timed("not_modified", f"/api/data/{telegram_id}", {"If-None-Match": full.headers["etag"]})
+        await timed("since", f"/api/data/{telegram_id}?since={full.json()['version']}")
+
+    async with api_client() as client:
+        seconds = await run_clients(args.concurrency, args.requests, one)
+
+    return {
+        "scenario": "data",
+        "users": args.users,
+        "requests": args.requests * 3,
+        "concurrency": args.concurrency,
+        "statuses": dict(statuses),
+        "seconds": round(seconds, 3),
+        "full_response_bytes": round(statistics.mean(sizes)),
+        **{kind: latency_summary(values) for kind, values in latencies.items()},
+    }
+
+async def complete_reminded_habits(share: float):
+    """Mark a share of today's reminded habits done, as if users checked them off"""
+    async with main.engine.begin() as conn:
+        await conn.execute(text("""
+            INSERT INTO habit_completions (telegram_id, habit_id, day)
+            SELECT r.telegram_id, r.habit_id, (r.reminded_at + make_interval(mins => u.timezone_offset))::date
+            FROM habit_reminders r JOIN users u ON u.telegram_id = r.telegram_id
+            WHERE random() < :share
+            ON CONFLICT DO NOTHING
+        """), {"share": share})
+
+async def bench_jobs(args) -> dict:
+    """Wall time of the scheduled jobs over every user, messages included"""
+    today = datetime.utcnow().date()
+    jobs = {}
+    async with bot_application(args) as (bot_app, sent):
+        steps = [
+            ("send_habit_reminders", lambda: main.send_habit_reminders(bot_app, [everyone(today)])),
+            (None, lambda: complete_reminded_habits(0.5)),
+            ("check_habit_completions", lambda: main.check_habit_completions(bot_app)),
+            ("ask_mood_checkin", lambda: main.ask_mood_checkin(bot_app, [everyone(today)])),
+        ]
+        for name, step in steps:
+            before = await sent()
+            started = time.perf_counter()
+            await step()
+            seconds = time.perf_counter() - started
+            if name:
+                messages = await sent() - before
+                jobs[name] = {"seconds": round(seconds, 3), "messages": messages,
+                              "messages_per_second": round(messages / seconds, 1)}
+
+    return {"scenario": "jobs", "users": args.users, "rate_limit": args.rate, "jobs": jobs}
+
+async def fleet_worker(url: str, rate: float):
+    """One process of the fleet scenario: fire the leased mood check-in once"""
+    try:
+        async with connect_bot(url, rate) as bot_app:
+            job = main.leased_job("mood_checkin", main.ask_mood_checkin)
+            shards = await job(bot_app, buckets=[everyone(datetime.utcnow().date())])
+    finally:
+        await main.engine.dispose()
+    print(json.dumps({"worker": main.WORKER_ID, "shards": sorted(shards)}))
+
+async def bench_fleet(args) -> dict:
+    """Several processes fire the leased mood check-in for the same slot at
+    once; every user has to get exactly one message however many there are"""
+    async with main.engine.begin() as conn:
+        await conn.execute(delete(main.JobLease))
+        recipients = await conn.scalar(select(func.count()).where(main.User.notifications_enabled == True))
+
+    async with fake_telegram() as (url, stats):
+        code = f"import asyncio, bench; asyncio.run(bench.fleet_worker({url!r}, {args.rate}))"
+        started = time.perf_counter()
+        workers = [
+            await asyncio.create_subprocess_exec(
+                sys.executable, "-c", code, stdout=asyncio.subprocess.PIPE,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                env={**os.environ, "JOB_SHARDS": str(args.shards), "BOT_PROCESSES": str(args.processes)}
+            )
+            for _ in range(args.processes)
+        ]
+        outputs = [(await worker.communicate())[0].decode().strip().splitlines() for worker in workers]
+        seconds = time.perf_counter() - started
+        counts = await stats()
+
+    return {
+        "scenario": "fleet",
+        "users": args.users,
+        "processes": args.processes,
+        "shards": args.shards,
+        "seconds": round(seconds, 3),
+        "recipients": recipients,
+        "messages": counts.get("sendMessage", 0),
+        "duplicates": counts.get("duplicates", 0),
+        "workers": [json.loads(lines[-1]) if lines else None for lines in outputs],
+    }
+
+async def bench_weekly(args) -> dict:
+    reports = 0
+    started = time.perf_counter()
+    async for _ in main.weekly_report_messages(everyone(datetime.utcnow().date())):
+        reports += 1
+    seconds = time.perf_counter() - started
+
+    return {
+        "scenario": "weekly_report",
+        "users": args.users,
+        "reports": reports,
+        "page_size": main.JOB_PAGE_SIZE,
+        "seconds": round(seconds, 3),
+        "users_per_second": round(args.users / seconds, 1),
+    }
+
+async def bench_insights(args) -> dict:
+    """Habit-mood insights over every user, INSIGHT_BATCH_USERS users per numpy batch"""
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    stored = await main.compute_habit_insights()
+    seconds = time.perf_counter() - started
+    cpu_seconds = time.process_time() - cpu_started
+    async with main.engine.connect() as conn:
+        significant = await conn.scalar(
+            select(func.count()).where(func.abs(main.HabitInsight.t_stat) >= main.INSIGHT_MIN_T)
+        )
+
+    return {
+        "scenario": "insights",
+        "users": args.users,
+        "days": args.days,
+        "batch_users": main.INSIGHT_BATCH_USERS,
+        "insights": stored,
+        "significant": significant,
+        "seconds": round(seconds, 3),
+        "cpu_seconds": round(cpu_seconds, 3),
+        "users_per_second": round(args.users / seconds, 1),
+    }
+
+def cpu_per_call(fn, repeat: int) -> float:
+    """Process CPU milliseconds per call"""
+    fn()
+    started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - started) * 1000 / repeat
+
+def parse_sync_body(body: bytes) -> main.SyncData:
+    """Run the FAST_JSON body parser to completion; it never actually suspends"""
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+    request = Request({"type": "http", "method": "POST", "path": "/api/sync", "headers": []}, receive)
+    try:
+        main.read_sync_body(request).send(None)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("read_sync_body suspended")
+
+async def bench_json(args) -> dict:
+    """Per-request CPU of a full-document sync and fetch, stdlib json vs FAST_JSON.
+    
+    Covers the three places a document is (de)serialized: parsing the /api/sync
+    body, the JSON column round trip, and encoding the /api/data response.
+    """
+    results = []
+    for size in (10_000, 100_000, 1_000_000):
+        doc = make_document(size)
+        body = json.dumps({"telegram_id": 1, "timezone_offset": 0, "data": doc}).encode()
+        column = json.dumps(doc)
+        payload = {"data": doc, "version": 1, "updated_at": datetime.utcnow().isoformat()}
+        repeat = max(3, 2_000_000 // len(body))
+        
+        stages = {
+            "stdlib": {
+                "parse_request": lambda: main.SyncData.model_validate(json.loads(body)),
+                "column_write": lambda: json.dumps(doc),
+                "column_read": lambda: json.loads(column),
+                "response": lambda: main.JSONResponse(jsonable_encoder(payload)),
+            },
+            "fast": {
+                "parse_request": lambda: parse_sync_body(body),
+                "column_write": lambda: main.dumps_json(doc),
+                "column_read": lambda: orjson.loads(column),
+                "response": lambda: main.ORJSONResponse(payload),
+            },
+        }
+        
+        row = {"document_bytes": len(body), "repeat": repeat}
+        for mode, fns in stages.items():
+            timings = {stage: round(cpu_per_call(fn, repeat), 3) for stage, fn in fns.items()}
+            timings["total"] = round(sum(timings.values()), 3)
+            row[f"{mode}_ms"] = timings
+        row["speedup"] = round(row["stdlib_ms"]["total"] / row["fast_ms"]["total"], 1)
+        results.append(row)
+    return {"scenario": "json", "results": results}
+
+async def bench_all(args) -> list[dict]:
+    # Read-only scenarios first: jobs and syncs change the data
+    return [await scenario(args) for scenario in (bench_data, bench_weekly, bench_insights, bench_jobs, bench_sync)]
+
+SCENARIOS = {"sync": bench_sync, "data": bench_data, "jobs": bench_jobs, "weekly": bench_weekly,
+             "insights": bench_insights, "fleet": bench_fleet, "all": bench_all, "json": bench_json}
+
+async def run(args):
+    try:
+        if args.scenario == "json":
+            print(json.dumps(await bench_json(args)))
+            return
+
+        for users in args.users:
+            run_args = argparse.Namespace(**{**vars(args), "users": users})
+            if not args.no_seed:
+                await reset_database()
+                started = time.perf_counter()
+                await seed(users, args.days, args.tx_per_day, args.habits)
+                print(f"seeded {users} users in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+            results = await SCENARIOS[args.scenario](run_args)
+            for result in results if isinstance(results, list) else [results]:
+                print(json.dumps(result), flush=True)
+    finally:
+        await main.engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenario", choices=SCENARIOS)
+    parser.add_argument("--users", type=int, nargs="+", default=[10000], help="one run per user count")
+    parser.add_argument("--days", type=int, default=30, help="days of history per user")
+    parser.add_argument("--tx-per-day", type=float, default=1.0)
+    parser.add_argument("--habits", type=int, default=3, help="habits per user")
+    parser.add_argument("--requests", type=int, default=2000, help="API requests per run (sync, data)")
+    parser.add_argument("--concurrency", type=int, default=50, help="concurrent API clients")
+    parser.add_argument("--rate", type=float, default=1e6,
+                        help=f"bot messages per second (production limit: {main.TELEGRAM_RATE_LIMIT:g})")
+    parser.add_argument("--processes", type=int, default=4, help="scheduler processes (fleet)")
+    parser.add_argument("--shards", type=int, default=8, help="JOB_SHARDS for the fleet processes")
+    parser.add_argument("--no-seed", action="store_true", help="reuse the data from the previous run")
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # one line per request otherwise
+    asyncio.run(run(parser.parse_args()))